@@ -3,54 +3,220 @@
 # -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
 
 import ctypes
-import types
-from typing import Any
+import inspect
+import logging
+from collections import deque
+from functools import cached_property
+from typing import ClassVar
 
 import pygxi.Feature as feat
 import pygxi.gxwrapper as gx
 
-from .errors import InvalidCallError, ParameterTypeError
+from .errors import InvalidCallError, OutOfRangeError, ParameterTypeError
 from .FeatureControl import FeatureControl
 from .gxidef import UNSIGNED_INT_MAX, UNSIGNED_LONG_LONG_MAX
 from .ImageProc import RawImage
 from .status import check_return_status
 
+logger = logging.getLogger(__name__)
+
+_UINT_MAX_HEX = hex(UNSIGNED_INT_MAX)
+_ULL_MAX_HEX = hex(UNSIGNED_LONG_LONG_MAX)
+
+# Maximum number of idle GxFrameData/RawImage pairs kept for reuse by each stream,
+# the image data itself is never reused
+FRAME_POOL_SIZE = 64
+# Maximum number of buffer IDs tracked in the dequeued buffer list, above that the
+# dequeued buffers are tracked in a dictionary
+FRAME_BUF_SLOTS_MAX = 1024
+
+
+_GxFrameBufferPtr = ctypes.POINTER(gx.GxFrameBuffer)
+_capture_param_at = gx.GxFrameCallbackParam.from_address
+
+
+def _with_features(cls):
+    """
+    :brief      Class decorator exposing every (name, feature class, feature ID) entry of
+                cls._FEATURES as an attribute that creates the feature on first access
+    :param      cls:    DataStream class
+    :return:    cls
+    """
+    # Every feature is also annotated on the class for type checkers, both must agree
+    features = cls.__dict__["_FEATURES"]
+    annotated = {
+        name: annotation
+        for name, annotation in inspect.get_annotations(cls).items()
+        if isinstance(annotation, type) and issubclass(annotation, feat.Feature)
+    }
+    declared = {name: feature_class for name, feature_class, _ in features}
+    if annotated != declared:
+        raise TypeError(
+            "%s: _FEATURES does not match the feature annotations" % cls.__name__
+        )
+
+    for name, feature_class, feature_id in features:
+        feature_property = cached_property(_feature_getter(feature_class, feature_id))
+        feature_property.__set_name__(cls, name)
+        setattr(cls, name, feature_property)
+    return cls
+
+
+def _feature_getter(feature_class, feature_id):
+    """
+    :brief      Build the getter creating a stream feature
+    :param      feature_class:  Feature class
+    :param      feature_id:     Feature ID
+    :return:    Getter function
+    """
+
+    def get_feature(self):
+        return feature_class(self._dev_handle, feature_id)
+
+    return get_feature
+
+
+class _FrameRing:
+    """
+    Bounded single-producer/single-consumer ring of preallocated frames.
+    The capture callback thread copies frames in with push(), the user thread
+    takes them out with drain(). Each index is only written by one side, so no
+    lock is needed; frames arriving while the ring is full are dropped.
+    """
+
+    def __init__(self, capacity, payload_size):
+        """
+        :param capacity:        Number of frames the ring can hold
+        :param payload_size:    Size of the buffer allocated for each frame
+        """
+        self.capacity = capacity
+        self.payload_size = payload_size
+        self.slots = []
+        self.slot_bufs = []
+        for _ in range(capacity):
+            frame_data = gx.GxFrameData()
+            frame_data.image_size = payload_size
+            frame_data.image_buf = None
+            self.slots.append(RawImage(frame_data))
+            self.slot_bufs.append(frame_data.image_buf)
+        self.head = 0  # next frame to drain, written by the consumer only
+        self.tail = 0  # next frame to fill, written by the producer only
+        self.dropped = 0
+
+    def push(self, capture_data_addr):
+        """
+        :brief      Copy a captured frame into the next free slot.
+                    Registered through CAP_CALL_ADDRESS, so the frame arrives as a
+                    plain address.
+        :param      capture_data_addr:  Address of the GxFrameCallbackParam of the frame
+        """
+        tail = self.tail
+        if tail - self.head >= self.capacity:
+            self.dropped += 1
+            return
+
+        frame = _capture_param_at(capture_data_addr)
+        image_size = frame.image_size
+        if image_size > self.payload_size:
+            self.dropped += 1
+            return
 
+        index = tail % self.capacity
+        frame_data = self.slots[index].frame_data
+        ctypes.memmove(self.slot_bufs[index], frame.image_buf, image_size)
+        frame_data.status = frame.status
+        frame_data.width = frame.width
+        frame_data.height = frame.height
+        frame_data.pixel_format = frame.pixel_format
+        frame_data.image_size = image_size
+        frame_data.frame_id = frame.frame_id
+        frame_data.timestamp = frame.timestamp
+        # Publish the slot only once it is completely written
+        self.tail = tail + 1
+
+    def drain(self, callback, max_frames):
+        """
+        :brief      Pass the available frames to callback, oldest first
+        :param      callback:   Function called with each image
+        :param      max_frames: Maximum number of frames to drain
+        :return:    Number of drained frames
+        """
+        head = self.head
+        count = min(self.tail - head, max_frames)
+        slots = self.slots
+        capacity = self.capacity
+        for index in range(head, head + count):
+            callback(slots[index % capacity])
+            # Hand the slot back to the producer once the callback is done with it
+            self.head = index + 1
+        return count
+
+
+@_with_features
 class DataStream:
+    _FEATURES: ClassVar[tuple[tuple[str, type[feat.Feature], int], ...]] = (
+        (
+            "StreamAnnouncedBufferCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_ANNOUNCED_BUFFER_COUNT,
+        ),
+        (
+            "StreamDeliveredFrameCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DELIVERED_FRAME_COUNT,
+        ),
+        ("StreamLostFrameCount", feat.IntFeature, gx.GxFeatureID.INT_LOST_FRAME_COUNT),
+        (
+            "StreamIncompleteFrameCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_INCOMPLETE_FRAME_COUNT,
+        ),
+        (
+            "StreamDeliveredPacketCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DELIVERED_PACKET_COUNT,
+        ),
+        (
+            "StreamBufferHandlingMode",
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_STREAM_BUFFER_HANDLING_MODE,
+        ),
+    )
+
+    StreamAnnouncedBufferCount: feat.IntFeature
+    StreamDeliveredFrameCount: feat.IntFeature
+    StreamLostFrameCount: feat.IntFeature
+    StreamIncompleteFrameCount: feat.IntFeature
+    StreamDeliveredPacketCount: feat.IntFeature
+    StreamBufferHandlingMode: feat.EnumFeature
+
     def __init__(self, dev_handle, stream_handle) -> None:
         """
         :brief  Constructor for instance initialization
         :param dev_handle:      Device handle
         :param stream_handle:   Device Stream handle
         """
-        self.__dev_handle = dev_handle
+        self._dev_handle = dev_handle
 
-        self.__c_capture_callback = gx.CAP_CALL(self.__on_capture_callback)
+        self.__c_capture_callback = None
         self.__py_capture_callback = None
+        self.__frame_ring = None
 
-        self.StreamAnnouncedBufferCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_ANNOUNCED_BUFFER_COUNT
-        )
-        self.StreamDeliveredFrameCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DELIVERED_FRAME_COUNT
-        )
-        self.StreamLostFrameCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_LOST_FRAME_COUNT
-        )
-        self.StreamIncompleteFrameCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_INCOMPLETE_FRAME_COUNT
-        )
-        self.StreamDeliveredPacketCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DELIVERED_PACKET_COUNT
-        )
-        self.StreamBufferHandlingMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_STREAM_BUFFER_HANDLING_MODE
-        )
         self.payload_size = 0
+        self.__payload_size_cache = 0
         self.acquisition_flag = False
         self.__data_stream_handle = stream_handle
         self.__stream_feature_control = FeatureControl(stream_handle)
-        self.__frame_buf_map: dict[int, Any] = {}
+        self.__frame_buf_arr: list[int | None] = []
+        self.__frame_buf_map: dict[int, int] = {}
+        # Out pointer reused by every dq_buf call, dequeued buffers are tracked
+        # by address so the pointer can be overwritten by the next call.
+        # Sharing it is why dq_buf must not run on several threads at once.
+        self.__dq_ptr = _GxFrameBufferPtr()
+        self.__dq_byref = ctypes.byref(self.__dq_ptr)
+        self.__frame_pool: deque[tuple[gx.GxFrameData, RawImage]] = deque(
+            maxlen=FRAME_POOL_SIZE
+        )
 
     def get_feature_control(self) -> FeatureControl:
         """
@@ -61,13 +227,35 @@ class DataStream:
 
     def get_payload_size(self) -> int:
         """
-        :brief      Get device stream payload size
+        :brief      Get device stream payload size.
+                    The value is cached until a feature that changes it is set through
+                    the Device, or invalidate_payload_size is called.
         :return:    Payload size
         """
+        if self.__payload_size_cache:
+            return self.__payload_size_cache
+
         status, stream_payload_size = gx.gx_get_payload_size(self.__data_stream_handle)
         check_return_status(status, "DataStreamHandle", "get_payload_size")
+        self.__payload_size_cache = stream_payload_size
         return stream_payload_size
 
+    def set_payload_size(self, payload_size: int) -> None:
+        """
+        :brief      Set the payload size used to allocate images in get_image,
+                    Device.stream_on sets it from get_payload_size
+        :param      payload_size:   Payload size
+        """
+        self.payload_size = payload_size
+
+    def invalidate_payload_size(self) -> None:
+        """
+        :brief      Drop the cached payload size, to be called when a feature that
+                    changes it has been set without going through the Device
+                    (e.g. with FeatureControl)
+        """
+        self.__payload_size_cache = 0
+
     def get_image(self, timeout=1000):
         """
         :brief          Get an image, get successfully create image class object
@@ -81,23 +269,36 @@ class DataStream:
             )
 
         if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
-            print(
+            raise OutOfRangeError(
                 "DataStream.get_image: "
-                "timeout out of bounds, minimum=0, maximum=%s"
-                % hex(UNSIGNED_INT_MAX).__str__()
+                "timeout out of bounds, minimum=0, maximum=%s" % _UINT_MAX_HEX
             )
-            return None
 
         if self.acquisition_flag is False:
-            print("DataStream.get_image: Current data steam don't  start acquisition")
+            logger.debug("DataStream.get_image: acquisition is not started")
             return None
 
-        frame_data = gx.GxFrameData()
+        return self._get_image_unchecked(timeout)
+
+    def _get_image_unchecked(self, timeout):
+        """
+        :brief          get_image without argument and state validation
+        :param          timeout:    Acquisition timeout, already validated
+        :return:        image object, None on timeout
+        """
+        try:
+            frame_data, image = self.__frame_pool.pop()
+        except IndexError:
+            frame_data, image = gx.GxFrameData(), None
+
         frame_data.image_size = self.payload_size
         frame_data.image_buf = None
-        image = RawImage(frame_data)
+        if image is None:
+            image = RawImage(frame_data)
+        else:
+            image.reset(frame_data)
 
-        status = gx.gx_get_image(self.__dev_handle, image.frame_data, timeout)
+        status = gx.gx_get_image(self._dev_handle, image.frame_data, timeout)
         if status == gx.GxStatusList.SUCCESS:
             return image
         elif status == gx.GxStatusList.TIMEOUT:
@@ -107,6 +308,13 @@ class DataStream:
             return None
 
     def dq_buf(self, timeout=1000):
+        """
+        :brief      Get an image referencing a driver buffer, the buffer must be
+                    returned with q_buf. A stream must not be dequeued from several
+                    threads at the same time.
+        :param      timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :return:    image object, None on timeout
+        """
         if not isinstance(timeout, int):
             raise ParameterTypeError(
                 "DataStream.dq_buf: "
@@ -114,28 +322,96 @@ class DataStream:
             )
 
         if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
-            print(
-                "DataStream.get_image: "
-                "timeout out of bounds, minimum=0, maximum=%s"
-                % hex(UNSIGNED_INT_MAX).__str__()
+            raise OutOfRangeError(
+                "DataStream.dq_buf: "
+                "timeout out of bounds, minimum=0, maximum=%s" % _UINT_MAX_HEX
             )
-            return None
 
-        if not self.__py_capture_callback:
+        if self.__py_capture_callback:
             raise InvalidCallError("Can't call DQBuf after register capture callback")
 
         if not self.acquisition_flag:
-            print("DataStream.get_image: Current data steam don't  start acquisition")
+            logger.debug("DataStream.dq_buf: acquisition is not started")
             return None
 
-        ptr_frame_buffer = ctypes.POINTER(gx.GxFrameBuffer)()
-        status = gx.gx_dq_buf(
-            self.__dev_handle, ctypes.byref(ptr_frame_buffer), timeout
-        )
+        return self._dq_buf_unchecked(timeout)
+
+    def dq_buf_batch(self, max_frames, timeout=1000):
+        """
+        :brief      Get up to max_frames images in a single call. Waits up to timeout
+                    for the first image, then only takes images that are already
+                    available. Every image must be returned with q_buf.
+                    If dequeuing fails, the images already taken are queued back
+                    before the error is raised.
+                    A stream must not be dequeued from several threads at the
+                    same time.
+        :param      max_frames: Maximum number of images, range:[1, 0xFFFFFFFF]
+        :param      timeout:    Acquisition timeout of the first image, range:[0, 0xFFFFFFFF]
+        :return:    list of image objects
+        """
+        if not isinstance(max_frames, int):
+            raise ParameterTypeError(
+                "DataStream.dq_buf_batch: "
+                "Expected max_frames type is int, not %s" % type(max_frames)
+            )
+
+        if not isinstance(timeout, int):
+            raise ParameterTypeError(
+                "DataStream.dq_buf_batch: "
+                "Expected timeout type is int, not %s" % type(timeout)
+            )
+
+        if (max_frames < 1) or (max_frames > UNSIGNED_INT_MAX):
+            raise OutOfRangeError(
+                "DataStream.dq_buf_batch: "
+                "max_frames out of bounds, minimum=1, maximum=%s" % _UINT_MAX_HEX
+            )
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            raise OutOfRangeError(
+                "DataStream.dq_buf_batch: "
+                "timeout out of bounds, minimum=0, maximum=%s" % _UINT_MAX_HEX
+            )
+
+        if self.__py_capture_callback:
+            raise InvalidCallError("Can't call DQBuf after register capture callback")
+
+        if not self.acquisition_flag:
+            logger.debug("DataStream.dq_buf_batch: acquisition is not started")
+            return []
+
+        dq_buf_unchecked = self._dq_buf_unchecked
+        images = []
+        append = images.append
+        try:
+            image = dq_buf_unchecked(timeout)
+            while image is not None:
+                append(image)
+                if len(images) == max_frames:
+                    break
+                image = dq_buf_unchecked(0)
+        except Exception:
+            # The caller never gets the images taken so far, hand them back
+            for image in images:
+                self._q_buf_unchecked(image)
+            raise
+        return images
+
+    def _dq_buf_unchecked(self, timeout):
+        """
+        :brief      dq_buf without argument and state validation
+        :param      timeout:    Acquisition timeout, already validated
+        :return:    image object, None on timeout
+        """
+        status = gx.gx_dq_buf(self._dev_handle, self.__dq_byref, timeout)
         if status == gx.GxStatusList.SUCCESS:
-            frame_buffer = ptr_frame_buffer.contents
-            self.__frame_buf_map[frame_buffer.buf_id] = ptr_frame_buffer
-            frame_data = gx.GxFrameData()
+            try:
+                frame_data, image = self.__frame_pool.pop()
+            except IndexError:
+                frame_data, image = gx.GxFrameData(), None
+
+            frame_buffer = self.__dq_ptr.contents
+            frame_buffer_addr = ctypes.addressof(frame_buffer)
             frame_data.status = frame_buffer.status
             frame_data.image_buf = frame_buffer.image_buf
             frame_data.width = frame_buffer.width
@@ -145,8 +421,17 @@ class DataStream:
             frame_data.frame_id = frame_buffer.frame_id
             frame_data.timestamp = frame_buffer.timestamp
             frame_data.buf_id = frame_buffer.buf_id
-
-            image = RawImage(frame_data)
+            buf_id = frame_data.buf_id
+            frame_buf_arr = self.__frame_buf_arr
+            if buf_id < len(frame_buf_arr):
+                frame_buf_arr[buf_id] = frame_buffer_addr
+            else:
+                self.__frame_buf_map[buf_id] = frame_buffer_addr
+
+            if image is None:
+                image = RawImage(frame_data)
+            else:
+                image.reset(frame_data)
             return image
         elif status == gx.GxStatusList.TIMEOUT:
             return None
@@ -155,6 +440,13 @@ class DataStream:
             return None
 
     def q_buf(self, image):
+        """
+        :brief      Return the buffer of an image obtained with dq_buf to the driver.
+                    The image object is recycled for later dq_buf calls and must
+                    not be used after this call, arrays already taken from it keep
+                    their own copy of the data.
+        :param      image:  RawImage returned by dq_buf
+        """
         if not isinstance(image, RawImage):
             raise ParameterTypeError(
                 "DataStream.q_buf: "
@@ -162,25 +454,42 @@ class DataStream:
             )
 
         if self.acquisition_flag is False:
-            print("DataStream.get_image: Current data steam don't  start acquisition")
+            logger.debug("DataStream.q_buf: acquisition is not started")
             return
 
-        if not self.__py_capture_callback:
-            raise InvalidCallError("Can't call DQBuf after register capture callback")
+        if self.__py_capture_callback:
+            raise InvalidCallError("Can't call QBuf after register capture callback")
 
-        ptr_frame_buffer = ctypes.POINTER(gx.GxFrameBuffer)()
-        try:
-            ptr_frame_buffer = self.__frame_buf_map[image.frame_data.buf_id]
-        except KeyError:
-            print(f"Key {image.frame_data.buf_id} not found in frame buffer map.")
+        self._q_buf_unchecked(image)
+
+    def _q_buf_unchecked(self, image):
+        """
+        :brief      q_buf without argument and state validation
+        :param      image:  RawImage returned by dq_buf
+        """
+        buf_id = image.frame_data.buf_id
+        frame_buf_arr = self.__frame_buf_arr
+        frame_buffer_addr = None
+        if buf_id < len(frame_buf_arr):
+            frame_buffer_addr = frame_buf_arr[buf_id]
+        in_frame_buf_arr = frame_buffer_addr is not None
+        if not in_frame_buf_arr:
+            frame_buffer_addr = self.__frame_buf_map.get(buf_id)
+
+        if frame_buffer_addr is None:
+            logger.warning("DataStream.q_buf: buffer %d was not dequeued", buf_id)
             return
 
-        status = gx.gx_q_buf(self.__dev_handle, ptr_frame_buffer)
+        status = gx.gx_q_buf(self._dev_handle, frame_buffer_addr)
         check_return_status(status, "DataStream", "q_buf")
-        self.__frame_buf_map.pop(image.frame_data.buf_id)
+        if in_frame_buf_arr:
+            frame_buf_arr[buf_id] = None
+        else:
+            del self.__frame_buf_map[buf_id]
+        self.__frame_pool.append((image.frame_data, image))
 
     def flush_queue(self):
-        status = gx.gx_flush_queue(self.__dev_handle)
+        status = gx.gx_flush_queue(self._dev_handle)
         check_return_status(status, "DataStream", "flush_queue")
 
     def set_acquisition_flag(self, flag: bool) -> None:
@@ -198,121 +507,259 @@ class DataStream:
             )
 
         if (buf_num < 1) or (buf_num > UNSIGNED_LONG_LONG_MAX):
-            print(
-                "DataStream.set_acquisition_buffer_number:"
-                "buf_num out of bounds, minimum=1, maximum=%s"
-                % hex(UNSIGNED_LONG_LONG_MAX).__str__()
+            raise OutOfRangeError(
+                "DataStream.set_acquisition_buffer_number: "
+                "buf_num out of bounds, minimum=1, maximum=%s" % _ULL_MAX_HEX
             )
-            return
 
-        status = gx.gx_set_acquisition_buffer_number(self.__dev_handle, buf_num)
+        status = gx.gx_set_acquisition_buffer_number(self._dev_handle, buf_num)
         check_return_status(status, "DataStream", "set_acquisition_buffer_number")
 
-    def register_capture_callback(self, callback_func):
+        # Buffer IDs are expected to lie in [0, buf_num), track them by index.
+        # Buffers still dequeued under the previous layout move to the dictionary.
+        for buf_id, frame_buffer_addr in enumerate(self.__frame_buf_arr):
+            if frame_buffer_addr is not None:
+                self.__frame_buf_map[buf_id] = frame_buffer_addr
+        self.__frame_buf_arr = [None] * min(buf_num, FRAME_BUF_SLOTS_MAX)
+
+    def register_capture_callback(self, callback_func, copy_image=False):
         """
         :brief      Register the capture event callback function.
-        :param      callback_func:  callback function
+                    By default the image passed to the callback references the driver
+                    buffer without copying it, and is only valid until the callback
+                    returns. Set copy_image to receive an image that owns its data.
+        :param      callback_func:  callback function, any callable such as a bound method
+        :param      copy_image:     copy every frame before invoking the callback
         :return:    none
         """
-        if not isinstance(callback_func, types.FunctionType):
+        if not callable(callback_func):
             raise ParameterTypeError(
                 "DataStream.register_capture_callback: "
-                "Expected callback type is function not %s" % type(callback_func)
+                "Expected callback to be callable, not %s" % type(callback_func)
             )
 
-        status = gx.gx_register_capture_callback(
-            self.__dev_handle, self.__c_capture_callback
+        c_capture_callback = gx.CAP_CALL(
+            self.__make_capture_callback(callback_func, copy_image)
         )
+        status = gx.gx_register_capture_callback(self._dev_handle, c_capture_callback)
         check_return_status(status, "DataStream", "register_capture_callback")
 
         # callback will not recorded when register callback failed.
+        self.__c_capture_callback = c_capture_callback
         self.__py_capture_callback = callback_func
+        self.__frame_ring = None
 
     def unregister_capture_callback(self):
         """
         :brief      Unregister the capture event callback function.
         :return:    none
         """
-        status = gx.gx_unregister_capture_callback(self.__dev_handle)
+        status = gx.gx_unregister_capture_callback(self._dev_handle)
         check_return_status(status, "DataStream", "unregister_capture_callback")
         self.__py_capture_callback = None
+        self.__frame_ring = None
 
-    def __on_capture_callback(self, capture_data):
+    def enable_ring(self, capacity):
         """
-        :brief      Capture event callback function with capture date.
+        :brief      Deliver captured frames through a ring buffer emptied with drain(),
+                    instead of invoking a callback on the driver thread.
+                    Each frame is copied into one of capacity buffers of payload size,
+                    frames captured while the ring is full are dropped.
+                    The ring is disabled by unregister_capture_callback.
+        :param      capacity:   Number of frames the ring can hold, range:[1, 0xFFFFFFFF]
         :return:    none
         """
-        frame_data = gx.GxFrameData()
-        frame_data.image_buf = capture_data.contents.image_buf
-        frame_data.width = capture_data.contents.width
-        frame_data.height = capture_data.contents.height
-        frame_data.pixel_format = capture_data.contents.pixel_format
-        frame_data.image_size = capture_data.contents.image_size
-        frame_data.frame_id = capture_data.contents.frame_id
-        frame_data.timestamp = capture_data.contents.timestamp
-        frame_data.status = capture_data.contents.status
-        image = RawImage(frame_data)
-        self.__py_capture_callback(image)
+        if not isinstance(capacity, int):
+            raise ParameterTypeError(
+                "DataStream.enable_ring: "
+                "Expected capacity type is int, not %s" % type(capacity)
+            )
 
+        if (capacity < 1) or (capacity > UNSIGNED_INT_MAX):
+            raise OutOfRangeError(
+                "DataStream.enable_ring: "
+                "capacity out of bounds, minimum=1, maximum=%s" % _UINT_MAX_HEX
+            )
 
-class U3VDataStream(DataStream):
-    def __init__(self, dev_handle, stream_handle):
-        self.__handle = dev_handle
-        DataStream.__init__(self, self.__handle, stream_handle)
-        self.StreamTransferSize = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_STREAM_TRANSFER_SIZE
-        )
-        self.StreamTransferNumberUrb = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_STREAM_TRANSFER_NUMBER_URB
-        )
-        self.StopAcquisitionMode = feat.EnumFeature(
-            self.__handle, gx.GxFeatureID.ENUM_STOP_ACQUISITION_MODE
-        )
+        self.invalidate_payload_size()
+        frame_ring = _FrameRing(capacity, self.get_payload_size())
+        c_capture_callback = gx.CAP_CALL_ADDRESS(frame_ring.push)
+        status = gx.gx_register_capture_callback(self._dev_handle, c_capture_callback)
+        check_return_status(status, "DataStream", "enable_ring")
 
+        self.__c_capture_callback = c_capture_callback
+        self.__py_capture_callback = frame_ring.push
+        self.__frame_ring = frame_ring
 
+    def drain(self, callback, max_frames=64):
+        """
+        :brief      Pass the frames collected by the ring to callback, oldest first.
+                    The image passed to callback is only valid until it returns.
+        :param      callback:   Function called with each image
+        :param      max_frames: Maximum number of frames to drain, range:[1, 0xFFFFFFFF]
+        :return:    Number of drained frames
+        """
+        if self.__frame_ring is None:
+            raise InvalidCallError("DataStream.drain: ring is not enabled")
+
+        if not callable(callback):
+            raise ParameterTypeError(
+                "DataStream.drain: "
+                "Expected callback to be callable, not %s" % type(callback)
+            )
+
+        if not isinstance(max_frames, int):
+            raise ParameterTypeError(
+                "DataStream.drain: "
+                "Expected max_frames type is int, not %s" % type(max_frames)
+            )
+
+        if (max_frames < 1) or (max_frames > UNSIGNED_INT_MAX):
+            raise OutOfRangeError(
+                "DataStream.drain: "
+                "max_frames out of bounds, minimum=1, maximum=%s" % _UINT_MAX_HEX
+            )
+
+        return self.__frame_ring.drain(callback, max_frames)
+
+    def get_ring_dropped_count(self):
+        """
+        :brief      Get the number of frames dropped because the ring was full
+        :return:    Number of dropped frames
+        """
+        if self.__frame_ring is None:
+            raise InvalidCallError(
+                "DataStream.get_ring_dropped_count: ring is not enabled"
+            )
+
+        return self.__frame_ring.dropped
+
+    @staticmethod
+    def __make_capture_callback(callback_func, copy_image):
+        """
+        :brief      Build the function invoked by the driver for every captured frame.
+                    Everything it needs is bound in its closure, so no global or
+                    attribute lookup happens per frame.
+        :param      callback_func:  user callback function
+        :param      copy_image:     copy every frame before invoking the callback
+        :return:    capture callback function
+        """
+        if not copy_image:
+            from_frame_buffer_view = RawImage.from_frame_buffer_view
+
+            def on_capture_callback(capture_data):
+                callback_func(from_frame_buffer_view(capture_data))
+
+            return on_capture_callback
+
+        frame_data_type = gx.GxFrameData
+        raw_image_type = RawImage
+
+        def on_capture_callback_copy(capture_data):
+            # GxFrameCallbackParam and GxFrameData have different layouts, a
+            # field by field copy is cheaper than memmoving the matching runs
+            frame = capture_data.contents
+            frame_data = frame_data_type()
+            frame_data.status = frame.status
+            frame_data.image_buf = frame.image_buf
+            frame_data.width = frame.width
+            frame_data.height = frame.height
+            frame_data.pixel_format = frame.pixel_format
+            frame_data.image_size = frame.image_size
+            frame_data.frame_id = frame.frame_id
+            frame_data.timestamp = frame.timestamp
+            callback_func(raw_image_type(frame_data))
+
+        return on_capture_callback_copy
+
+
+@_with_features
+class U3VDataStream(DataStream):
+    _FEATURES: ClassVar[tuple[tuple[str, type[feat.Feature], int], ...]] = (
+        (
+            "StreamTransferSize",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_STREAM_TRANSFER_SIZE,
+        ),
+        (
+            "StreamTransferNumberUrb",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_STREAM_TRANSFER_NUMBER_URB,
+        ),
+        (
+            "StopAcquisitionMode",
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_STOP_ACQUISITION_MODE,
+        ),
+    )
+
+    StreamTransferSize: feat.IntFeature
+    StreamTransferNumberUrb: feat.IntFeature
+    StopAcquisitionMode: feat.EnumFeature
+
+
+@_with_features
 class GEVDataStream(DataStream):
-    def __init__(self, dev_handle, stream_handle):
-        self.__handle = dev_handle
-        DataStream.__init__(self, self.__handle, stream_handle)
-        self.StreamResendPacketCount = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_RESEND_PACKET_COUNT
-        )
-        self.StreamRescuedPacketCount = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_RESCUED_PACKET_COUNT
-        )
-        self.StreamResendCommandCount = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_RESEND_COMMAND_COUNT
-        )
-        self.StreamUnexpectedPacketCount = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_UNEXPECTED_PACKET_COUNT
-        )
-        self.MaxPacketCountInOneBlock = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_BLOCK
-        )
-        self.MaxPacketCountInOneCommand = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_COMMAND
-        )
-        self.ResendTimeout = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_RESEND_TIMEOUT
-        )
-        self.MaxWaitPacketCount = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_MAX_WAIT_PACKET_COUNT
-        )
-        self.ResendMode = feat.EnumFeature(
-            self.__handle, gx.GxFeatureID.ENUM_RESEND_MODE
-        )
-        self.StreamMissingBlockIDCount = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_MISSING_BLOCK_ID_COUNT
-        )
-        self.BlockTimeout = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_BLOCK_TIMEOUT
-        )
-        self.MaxNumQueueBuffer = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_MAX_NUM_QUEUE_BUFFER
-        )
-        self.PacketTimeout = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_PACKET_TIMEOUT
-        )
-        self.SocketBufferSize = feat.IntFeature(
-            self.__handle, gx.GxFeatureID.INT_SOCKET_BUFFER_SIZE
-        )
+    _FEATURES: ClassVar[tuple[tuple[str, type[feat.Feature], int], ...]] = (
+        (
+            "StreamResendPacketCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RESEND_PACKET_COUNT,
+        ),
+        (
+            "StreamRescuedPacketCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RESCUED_PACKET_COUNT,
+        ),
+        (
+            "StreamResendCommandCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RESEND_COMMAND_COUNT,
+        ),
+        (
+            "StreamUnexpectedPacketCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_UNEXPECTED_PACKET_COUNT,
+        ),
+        (
+            "MaxPacketCountInOneBlock",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_BLOCK,
+        ),
+        (
+            "MaxPacketCountInOneCommand",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_COMMAND,
+        ),
+        ("ResendTimeout", feat.IntFeature, gx.GxFeatureID.INT_RESEND_TIMEOUT),
+        (
+            "MaxWaitPacketCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_MAX_WAIT_PACKET_COUNT,
+        ),
+        ("ResendMode", feat.EnumFeature, gx.GxFeatureID.ENUM_RESEND_MODE),
+        (
+            "StreamMissingBlockIDCount",
+            feat.IntFeature,
+            gx.GxFeatureID.INT_MISSING_BLOCK_ID_COUNT,
+        ),
+        ("BlockTimeout", feat.IntFeature, gx.GxFeatureID.INT_BLOCK_TIMEOUT),
+        ("MaxNumQueueBuffer", feat.IntFeature, gx.GxFeatureID.INT_MAX_NUM_QUEUE_BUFFER),
+        ("PacketTimeout", feat.IntFeature, gx.GxFeatureID.INT_PACKET_TIMEOUT),
+        ("SocketBufferSize", feat.IntFeature, gx.GxFeatureID.INT_SOCKET_BUFFER_SIZE),
+    )
+
+    StreamResendPacketCount: feat.IntFeature
+    StreamRescuedPacketCount: feat.IntFeature
+    StreamResendCommandCount: feat.IntFeature
+    StreamUnexpectedPacketCount: feat.IntFeature
+    MaxPacketCountInOneBlock: feat.IntFeature
+    MaxPacketCountInOneCommand: feat.IntFeature
+    ResendTimeout: feat.IntFeature
+    MaxWaitPacketCount: feat.IntFeature
+    ResendMode: feat.EnumFeature
+    StreamMissingBlockIDCount: feat.IntFeature
+    BlockTimeout: feat.IntFeature
+    MaxNumQueueBuffer: feat.IntFeature
+    PacketTimeout: feat.IntFeature
+    SocketBufferSize: feat.IntFeature
@@ -1135,7 +1135,28 @@ class Device:
             )
             check_return_status(status, "Device", "__get_stream_handle")
 
-            self.data_stream.append(DataStream(self.__dev_handle, stream_handle))
+            data_stream = DataStream(self.__dev_handle, stream_handle)
+            for feature in self.__payload_size_features():
+                feature._add_set_listener(data_stream.invalidate_payload_size)
+            self.data_stream.append(data_stream)
+
+    def __payload_size_features(self):
+        """
+        :brief      Get the features whose value changes the stream payload size
+        :return:    tuple of features
+        """
+        return (
+            self.Width,
+            self.Height,
+            self.BinningHorizontal,
+            self.BinningVertical,
+            self.DecimationHorizontal,
+            self.DecimationVertical,
+            self.PixelSize,
+            self.PixelFormat,
+            self.ChunkModeActive,
+            self.ChunkEnable,
+        )
 
     def get_stream_channel_num(self):
         """
@@ -1270,9 +1291,12 @@ class Device:
         )
         check_return_status(status, "Device", "stream_on")
 
-        payload_size = self.data_stream[0].get_payload_size()
-        self.data_stream[0].set_payload_size(payload_size)
-        self.data_stream[0].set_acquisition_flag(True)
+        # ROI and pixel format may have been set through FeatureControl while the
+        # acquisition was stopped, which the payload size cache does not see
+        data_stream = self.data_stream[0]
+        data_stream.invalidate_payload_size()
+        data_stream.set_payload_size(data_stream.get_payload_size())
+        data_stream.set_acquisition_flag(True)
 
     def stream_off(self, stream_index=0):
         """
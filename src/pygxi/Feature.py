@@ -19,6 +19,7 @@ class Feature:
         """
         self.__handle = handle
         self.__feature = feature
+        self.__set_listeners = []
         self.feature_name = self.get_name()
 
     def get_name(self):
@@ -33,6 +34,20 @@ class Feature:
 
         return name
 
+    def _add_set_listener(self, listener):
+        """
+        :brief      Call listener after every successful set of the feature value
+        :param      listener:   function called without arguments
+        """
+        self.__set_listeners.append(listener)
+
+    def _notify_set(self):
+        """
+        :brief      Call the listeners added with _add_set_listener
+        """
+        for listener in self.__set_listeners:
+            listener()
+
     def is_implemented(self):
         """
         brief:  Determining whether the feature is implemented
@@ -153,6 +168,7 @@ class IntFeature(Feature):
 
         status = gx.gx_set_int(self.__handle, self.__feature, int_value)
         check_return_status(status, "IntFeature", "set")
+        self._notify_set()
 
 
 class FloatFeature(Feature):
@@ -314,6 +330,7 @@ class EnumFeature(Feature):
 
         status = gx.gx_set_enum(self.__handle, self.__feature, enum_value)
         check_return_status(status, "EnumFeature", "set")
+        self._notify_set()
 
 
 class BoolFeature(Feature):
@@ -357,6 +374,7 @@ class BoolFeature(Feature):
 
         status = gx.gx_set_bool(self.__handle, self.__feature, bool_value)
         check_return_status(status, "BoolFeature", "set")
+        self._notify_set()
 
 
 class StringFeature(Feature):
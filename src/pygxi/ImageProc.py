@@ -294,16 +294,48 @@ class RGBImage:
 
 
 class RawImage:
+    # Created for every frame: no per-instance __dict__
+    __slots__ = ("__image_array", "frame_data")
+
     def __init__(self, frame_data):
-        self.frame_data = frame_data
+        self.reset(frame_data)
 
-        if self.frame_data.image_buf is not None:
+    @classmethod
+    def from_frame_buffer_view(cls, p_frame_buffer):
+        """
+        :brief      Wrap a frame owned by the driver without copying it.
+                    The image references driver memory: it is only valid until the
+                    buffer is handed back to the driver, e.g. when the capture
+                    callback returns.
+        :param      p_frame_buffer: pointer to a GxFrameCallbackParam or GxFrameBuffer
+        :return:    RawImage object
+        """
+        image = cls.__new__(cls)
+        image.frame_data = frame_data = p_frame_buffer.contents
+        if frame_data.image_buf is not None:
+            image.__image_array = (ct.c_ubyte * frame_data.image_size).from_address(
+                frame_data.image_buf
+            )
+        else:
+            image.__image_array = (ct.c_ubyte * 0)()
+        return image
+
+    def reset(self, frame_data):
+        """
+        :brief      Re-initialize the image with new frame data.
+                    The image data always gets a new buffer: arrays returned for the
+                    previous frame stay untouched.
+        :param      frame_data:     frame data
+        :return:    None
+        """
+        self.frame_data = frame_data
+        if frame_data.image_buf is not None:
             self.__image_array = ct.string_at(
-                self.frame_data.image_buf, self.frame_data.image_size
+                frame_data.image_buf, frame_data.image_size
             )
         else:
-            self.__image_array = (ct.c_ubyte * self.frame_data.image_size)()
-            self.frame_data.image_buf = ct.addressof(self.__image_array)
+            self.__image_array = (ct.c_ubyte * frame_data.image_size)()
+            frame_data.image_buf = ct.addressof(self.__image_array)
 
     def __pixel_format_raw16_to_raw8(self, pixel_format):
         """
@@ -1294,30 +1326,79 @@ class RawImage:
             print("RawImage.get_numpy_array: This is a incomplete image")
             return None
 
+        return self.__buffer_to_numpy_array(self.__image_array)
+
+    def as_ndarray(self):
+        """
+        :brief      Return a np.Array view over the image buffer referenced by the frame
+                    data, without copying it. The view keeps a buffer owned by the image
+                    alive. When the frame data references driver memory, as for images
+                    obtained with dq_buf or in a capture callback, the view is only valid
+                    until the buffer is handed back to the driver (q_buf, or the
+                    callback returning).
+                    Shaped like get_numpy_array, except for MONO10_PACKED and
+                    MONO12_PACKED images, returned as the 1-D packed bytes,
+                    Image.height * Image.width * 3 / 2 long.
+        :return:    np.Array objects, None for incomplete images or unsupported formats
+        """
+        if self.frame_data.status != GxFrameStatusList.SUCCESS:
+            return None
+
+        if self.frame_data.image_buf is None:
+            return None
+
+        image_buffer = self.__image_array
+        if not (
+            isinstance(image_buffer, ct.Array)
+            and ct.addressof(image_buffer) == self.frame_data.image_buf
+        ):
+            image_buffer = (ct.c_ubyte * self.frame_data.image_size).from_address(
+                self.frame_data.image_buf
+            )
+
+        if self.frame_data.pixel_format in (
+            GxPixelFormatEntry.MONO10_PACKED,
+            GxPixelFormatEntry.MONO12_PACKED,
+        ):
+            # Two pixels share three bytes, the packed data is returned unchanged
+            return np.frombuffer(
+                image_buffer,
+                dtype=np.ubyte,
+                count=self.frame_data.width * self.frame_data.height * 3 // 2,
+            )
+
+        return self.__buffer_to_numpy_array(image_buffer)
+
+    def __buffer_to_numpy_array(self, image_buffer):
+        """
+        :brief      Wrap an image buffer in a np.Array shaped after the frame data
+        :param      image_buffer:   buffer holding the image data
+        :return:    np.Array objects, None for unsupported formats
+        """
         image_size = self.frame_data.width * self.frame_data.height
 
         if self.frame_data.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_8BIT:
             image_np = np.frombuffer(
-                self.__image_array, dtype=np.ubyte, count=image_size
+                image_buffer, dtype=np.ubyte, count=image_size
             ).reshape(self.frame_data.height, self.frame_data.width)
         elif self.frame_data.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_16BIT:
             image_np = np.frombuffer(
-                self.__image_array, dtype=np.uint16, count=image_size
+                image_buffer, dtype=np.uint16, count=image_size
             ).reshape(self.frame_data.height, self.frame_data.width)
         elif self.frame_data.pixel_format == GxPixelFormatEntry.RGB8:
             image_np = np.frombuffer(
-                self.__image_array, dtype=np.ubyte, count=image_size * 3
+                image_buffer, dtype=np.ubyte, count=image_size * 3
             ).reshape(self.frame_data.height, self.frame_data.width, 3)
         elif self.frame_data.pixel_format == GxPixelFormatEntry.BGR8:
             image_np = np.frombuffer(
-                self.__image_array, dtype=np.ubyte, count=image_size * 3
+                image_buffer, dtype=np.ubyte, count=image_size * 3
             ).reshape(self.frame_data.height, self.frame_data.width, 3)
         elif self.frame_data.pixel_format in (
             GxPixelFormatEntry.MONO10_PACKED,
             GxPixelFormatEntry.MONO12_PACKED,
         ):
             image_np = np.frombuffer(
-                self.__image_array, dtype=np.ubyte, count=image_size
+                image_buffer, dtype=np.ubyte, count=image_size
             ).reshape(self.frame_data.height, self.frame_data.width)
         else:
             image_np = None
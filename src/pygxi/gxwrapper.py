@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 NODE_FEATURE_RESERVED_16 = 16
 
+# The library must be loaded with CDLL/WinDLL and never PyDLL: ctypes then releases
+# the GIL for the duration of every call, so streams blocked in GXDQBuf/GXGetImage
+# on different threads do not serialize on the interpreter.
 if sys.platform == "linux2" or sys.platform == "linux":
     try:
         dll = ct.CDLL("/usr/lib/libgxiapi.so")
@@ -2765,13 +2768,17 @@ if hasattr(dll, "GXSendCommand"):
 
 
 CAP_CALL = ct.CFUNCTYPE(None, ct.POINTER(GxFrameCallbackParam))
+# Same signature as CAP_CALL, the GxFrameCallbackParam is passed as a plain address
+# so no pointer object is built for every frame
+CAP_CALL_ADDRESS = ct.CFUNCTYPE(None, ct.c_void_p)
 if hasattr(dll, "GXRegisterCaptureCallback"):
 
     def gx_register_capture_callback(handle, cap_call):
         """
         :brief      Register the capture callback function
         :param      handle:         The handle of the device
-        :param      cap_call:       The callback function that the user will register(@ CAP_CALL)
+        :param      cap_call:       The callback function that the user will register
+                                    (@ CAP_CALL or CAP_CALL_ADDRESS)
         :return:    status:         State return value, See detail in GxStatusList
         """
         handle_c = ct.c_void_p()
@@ -2797,11 +2804,15 @@ if hasattr(dll, "GXUnregisterCaptureCallback"):
 
 
 if hasattr(dll, "GXGetImage"):
+    # Prototype bound once at import: this is called for every frame
+    dll.GXGetImage.argtypes = [ct.c_void_p, ct.POINTER(GxFrameData), ct.c_uint]
+    dll.GXGetImage.restype = ct.c_int
 
     def gx_get_image(handle, frame_data, timeout=200):
         """
         :brief      After starting acquisition, you can call this function to get images directly.
                     Noting that the interface can not be mixed with the callback capture mode.
+                    The GIL is released while waiting for the image.
         :param      handle:         The handle of the device
                                     Type: Long, Greater than 0
         :param      frame_data:     [out]User introduced to receive the image data
@@ -2810,22 +2821,23 @@ if hasattr(dll, "GXGetImage"):
                                     Type: int, minnum: 0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        timeout_c = ct.c_uint()
-        timeout_c.value = timeout
-
-        status = dll.GXGetImage(handle_c, ct.byref(frame_data), timeout_c)
-        return status
+        return dll.GXGetImage(handle, ct.byref(frame_data), timeout)
 
 
 if hasattr(dll, "GXDQBuf"):
+    # Prototype bound once at import: this is called for every frame
+    dll.GXDQBuf.argtypes = [
+        ct.c_void_p,
+        ct.POINTER(ct.POINTER(GxFrameBuffer)),
+        ct.c_uint,
+    ]
+    dll.GXDQBuf.restype = ct.c_int
 
     def gx_dq_buf(handle, pp_frame_buffer, timeout=200):
         """
         :brief      After starting acquisition, you can call this function to get images directly.
                     Noting that the interface can not be mixed with the callback capture mode.
+                    The GIL is released while waiting for the image.
         :param      handle:         The handle of the device
                                     Type: Long, Greater than 0
         :param      pp_frame_buffer:[out]User introduced to receive the image data
@@ -2834,24 +2846,15 @@ if hasattr(dll, "GXDQBuf"):
                                     Type: int, minnum: 0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        timeout_c = ct.c_uint()
-        timeout_c.value = timeout
-
-        dll.GXDQBuf.argtypes = [
-            ct.c_void_p,
-            ct.POINTER(ct.POINTER(GxFrameBuffer)),
-            ct.c_uint,
-        ]
-        dll.GXDQBuf.restype = ct.c_int
-
-        status = dll.GXDQBuf(handle_c, pp_frame_buffer, timeout_c)
-        return status
+        return dll.GXDQBuf(handle, pp_frame_buffer, timeout)
 
 
 if hasattr(dll, "GXQBuf"):
+    # Prototype bound once at import: this is called for every frame.
+    # The frame buffer is declared as c_void_p so both pointer objects and plain
+    # addresses are accepted.
+    dll.GXQBuf.argtypes = [ct.c_void_p, ct.c_void_p]
+    dll.GXQBuf.restype = ct.c_int
 
     def gx_q_buf(handle, p_frame_buffer):
         """
@@ -2859,20 +2862,15 @@ if hasattr(dll, "GXQBuf"):
         :param      handle:         The handle of the device
                                     Type: Long, Greater than 0
         :param      p_frame_buffer: [out]User introduced to receive the image data
-                                    Type: First level pointer
+                                    Type: First level pointer or buffer address
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        dll.GXQBuf.argtypes = [ct.c_void_p, ct.POINTER(GxFrameBuffer)]
-        dll.GXQBuf.restype = ct.c_int
-
-        status = dll.GXQBuf(handle_c, p_frame_buffer)
-        return status
+        return dll.GXQBuf(handle, p_frame_buffer)
 
 
 if hasattr(dll, "GXFlushQueue"):
+    dll.GXFlushQueue.argtypes = [ct.c_void_p]
+    dll.GXFlushQueue.restype = ct.c_int
 
     def gx_flush_queue(handle):
         """
@@ -2881,11 +2879,7 @@ if hasattr(dll, "GXFlushQueue"):
                                 Type: Long, Greater than 0
         :return:    status:     State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        status = dll.GXFlushQueue(handle_c)
-        return status
+        return dll.GXFlushQueue(handle)
 
 
 OFF_LINE_CALL = ct.CFUNCTYPE(None, ct.c_void_p)